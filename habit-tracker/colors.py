@@ -0,0 +1,23 @@
+from __future__ import annotations
+import numpy as np
+
+# Color helpers (no tkinter, testable)
+def rgb_to_hex(rgb: tuple[int,int,int]) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+def interp(a: tuple[int,int,int], b: tuple[int,int,int], t: float) -> tuple[int,int,int]:
+    return (int(a[0] + (b[0]-a[0])*t),
+            int(a[1] + (b[1]-a[1])*t),
+            int(a[2] + (b[2]-a[2])*t))
+
+def gradient_colors(a: tuple[int,int,int], b: tuple[int,int,int], steps: int) -> np.ndarray:
+    # all interp(a, b, t) colors for t in [0, 1] as one (steps, 3) uint8 array
+    t = np.linspace(0.0, 1.0, steps)[:, None]
+    start = np.array(a, dtype=np.float64)
+    end = np.array(b, dtype=np.float64)
+    return (start + (end - start) * t).astype(np.uint8)
+
+def build_gradient(w: int, h: int, top: tuple[int,int,int], bottom: tuple[int,int,int]) -> np.ndarray:
+    # (h, w, 3) pixel array of a top-to-bottom gradient, every row is one color
+    rows = gradient_colors(top, bottom, h)
+    return np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (h, w, 3)))
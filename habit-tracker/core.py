@@ -0,0 +1,148 @@
+from __future__ import annotations
+import orjson
+import datetime
+import os
+import stat
+from typing import Dict, Any, Tuple
+
+# Config
+DEFAULT_FILE = "habits.json"
+
+DEFAULT_HABITS = [
+    "Drink Water",
+    "Read 20 minutes",
+    "Exercise 10 minutes",
+    "Meditate",
+    "Journal",
+    "Sleep Early",
+    "Coding practice"
+]
+
+# Core functions (testable)
+def load_habits(filename: str = DEFAULT_FILE) -> Dict[str, Dict[str, Any]]:
+    try:
+        # read the whole file in one call, then parse the buffer
+        with open(filename, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw)
+        if not isinstance(data, dict):
+            return {}
+        return data
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+def save_habits(habits: Dict[str, Dict[str, Any]], filename: str = DEFAULT_FILE) -> None:
+    # serialize first, then write a temp file in one call and swap it in,
+    # so a crash mid-save never leaves a half-written habits file
+    buf = orjson.dumps(habits, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    tmp = filename + ".tmp"
+    # keep the permissions of an existing habits file across the replace
+    try:
+        mode = stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        mode = None
+    # O_BINARY: on Windows a low-level fd is text mode by default and would turn \n into \r\n
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp, flags, 0o644)
+    try:
+        try:
+            if mode is not None:
+                os.chmod(tmp, mode)
+            # os.write may write less than asked (e.g. disk nearly full)
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, filename)
+    except BaseException:
+        # never leave a partial temp file behind; the original stays untouched
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+def add_habit(habits: Dict[str, Dict[str, Any]], name: str) -> Dict[str, Dict[str, Any]]:
+    name = name.strip()
+    if not name:
+        raise ValueError("Habit name cannot be empty")
+    if name.startswith("_"):
+        # keys like "_meta" are reserved for bookkeeping
+        raise ValueError("Habit name cannot start with '_'")
+    if name in habits:
+        raise ValueError("Habit already exists")
+    habits[name] = {"done": False, "streak": 0, "last_done": None}
+    return habits
+
+def _parse_ymd(s: str) -> datetime.date:
+    # dates are always stored as YYYY-MM-DD, no need for the general ISO parser
+    return datetime.date(int(s[:4]), int(s[5:7]), int(s[8:10]))
+
+def mark_done(habits: Dict[str, Dict[str, Any]], name: str, today: str | None = None) -> Dict[str, Dict[str, Any]]:
+    if name not in habits:
+        raise KeyError("Habit not found")
+    if today is None:
+        today = datetime.date.today().isoformat()
+    info = habits[name]
+    last = info.get("last_done")
+    # update streak only if last was yesterday
+    if last:
+        last_date = _parse_ymd(last)
+        today_date = _parse_ymd(today)
+        if last_date == today_date - datetime.timedelta(days=1):
+            info["streak"] = info["streak"] + 1
+        elif last_date == today_date:
+            # already marked today — no change
+            pass
+        else:
+            info["streak"] = 1
+    else:
+        info["streak"] = 1
+    info["done"] = True
+    info["last_done"] = today
+    return habits
+
+def unmark_habit(habits: Dict[str, Dict[str, Any]], name: str) -> Dict[str, Dict[str, Any]]:
+    if name not in habits:
+        raise KeyError("Habit not found")
+    habits[name]["done"] = False
+    return habits
+
+def delete_habit(habits: Dict[str, Dict[str, Any]], name: str) -> Dict[str, Dict[str, Any]]:
+    if name not in habits:
+        raise KeyError("Habit not found")
+    del habits[name]
+    return habits
+
+def reset_daily(habits: Dict[str, Dict[str, Any]], today: str | None = None) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+
+    if today is None:
+        today = datetime.date.today().isoformat()
+    meta = habits.get("_meta", {})
+    last_reset = meta.get("last_reset")
+    if last_reset == today:
+        return habits, False  # already reset today
+    # perform reset
+    for k, v in habits.items():
+        if k == "_meta":
+            continue
+        if isinstance(v, dict):
+            v["done"] = False
+    habits["_meta"] = {"last_reset": today}
+    return habits, True
+
+# Utility
+def ensure_defaults(habits: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+    # if no user habits (only meta missing), populate defaults; the caller saves
+    if not any(not k.startswith("_") for k in habits):
+        for h in DEFAULT_HABITS:
+            try:
+                add_habit(habits, h)
+            except ValueError:
+                pass
+        # set initial meta
+        habits["_meta"] = {"last_reset": datetime.date.today().isoformat()}
+        return habits, True
+    return habits, False
@@ -1,25 +1,15 @@
 from __future__ import annotations
-import json
-import datetime
+import bisect
 import math
-import os
 import tkinter as tk
 from tkinter import messagebox
-from typing import Dict, Any
+from typing import Dict
 from pathlib import Path
+from PIL import Image, ImageDraw, ImageTk
 
-# Config
-DEFAULT_FILE = "habits.json"
-
-DEFAULT_HABITS = [
-    "Drink Water",
-    "Read 20 minutes",
-    "Exercise 10 minutes",
-    "Meditate",
-    "Journal",
-    "Sleep Early",
-    "Coding practice"
-]
+from colors import rgb_to_hex, interp, build_gradient
+from core import (load_habits, save_habits, add_habit, mark_done, unmark_habit,
+                  delete_habit, reset_daily, ensure_defaults)
 
 # UI colors (gradient light -> ocean)
 GRAD_TOP = (243, 251, 255)   # #F3FBFF
@@ -32,127 +22,43 @@ MUTED = "#5F7A89"
 ICON_SIZE = 28
 CARD_WIDTH = 260
 CARD_HEIGHT = 100  # option B: medium cards
-
-# Core functions (testable)
-def load_habits(filename: str = DEFAULT_FILE) -> Dict[str, Dict[str, Any]]:
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                return {}
-            return data
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
-
-def save_habits(habits: Dict[str, Dict[str, Any]], filename: str = DEFAULT_FILE) -> None:
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(habits, f, ensure_ascii=False, indent=2)
-
-def add_habit(habits: Dict[str, Dict[str, Any]], name: str) -> Dict[str, Dict[str, Any]]:
-    name = name.strip()
-    if not name:
-        raise ValueError("Habit name cannot be empty")
-    if name in habits:
-        raise ValueError("Habit already exists")
-    habits[name] = {"done": False, "streak": 0, "last_done": None}
-    return habits
-
-def mark_done(habits: Dict[str, Dict[str, Any]], name: str, today: str | None = None) -> Dict[str, Dict[str, Any]]:
-    if name not in habits:
-        raise KeyError("Habit not found")
-    if today is None:
-        today = datetime.date.today().isoformat()
-    info = habits[name]
-    last = info.get("last_done")
-    # update streak only if last was yesterday
-    if last:
-        last_date = datetime.date.fromisoformat(last)
-        if last_date == datetime.date.fromisoformat(today) - datetime.timedelta(days=1):
-            info["streak"] = info.get("streak", 0) + 1
-        elif last_date == datetime.date.fromisoformat(today):
-            # already marked today — no change
-            pass
-        else:
-            info["streak"] = 1
-    else:
-        info["streak"] = 1
-    info["done"] = True
-    info["last_done"] = today
-    habits[name] = info
-    return habits
-
-def unmark_habit(habits: Dict[str, Dict[str, Any]], name: str) -> Dict[str, Dict[str, Any]]:
-    if name not in habits:
-        raise KeyError("Habit not found")
-    habits[name]["done"] = False
-    return habits
-
-def delete_habit(habits: Dict[str, Dict[str, Any]], name: str) -> Dict[str, Dict[str, Any]]:
-    if name not in habits:
-        raise KeyError("Habit not found")
-    del habits[name]
-    return habits
-
-def reset_daily(habits: Dict[str, Dict[str, Any]], today: str | None = None) -> Dict[str, Dict[str, Any]]:
-
-    if today is None:
-        today = datetime.date.today().isoformat()
-    meta = habits.get("_meta", {})
-    last_reset = meta.get("last_reset")
-    if last_reset == today:
-        return habits  # already reset today
-    # perform reset
-    for k, v in list(habits.items()):
-        if k == "_meta":
-            continue
-        if isinstance(v, dict):
-            v["done"] = False
-    habits["_meta"] = {"last_reset": today}
-    return habits
-
-# Utility
-def ensure_defaults(habits: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-    # if no user habits (only meta missing), populate defaults
-    names = [k for k in habits.keys() if not k.startswith("_")]
-    if not names:
-        for h in DEFAULT_HABITS:
-            try:
-                add_habit(habits, h)
-            except ValueError:
-                pass
-        # set initial meta
-        habits["_meta"] = {"last_reset": datetime.date.today().isoformat()}
-        save_habits(habits)
-    return habits
-
-# UI helpers
-def rgb_to_hex(rgb: tuple[int,int,int]) -> str:
-    return "#{:02x}{:02x}{:02x}".format(*rgb)
-
-def interp(a: tuple[int,int,int], b: tuple[int,int,int], t: float) -> tuple[int,int,int]:
-    return (int(a[0] + (b[0]-a[0])*t),
-            int(a[1] + (b[1]-a[1])*t),
-            int(a[2] + (b[2]-a[2])*t))
-
-# draw rounded rectangle on canvas
-def create_rounded_rect(canvas: tk.Canvas, x1, y1, x2, y2, r=12, **kwargs):
-    # corner ovals
-    points = [
-        (x1+r, y1, x2-r, y2),
-    ]
-    # create shape using polygon with arcs approximation
-    canvas.create_arc(x1, y1, x1+2*r, y1+2*r, start=90, extent=90, style="pieslice", **kwargs)
-    canvas.create_arc(x2-2*r, y1, x2, y1+2*r, start=0, extent=90, style="pieslice", **kwargs)
-    canvas.create_arc(x2-2*r, y2-2*r, x2, y2, start=270, extent=90, style="pieslice", **kwargs)
-    canvas.create_arc(x1, y2-2*r, x1+2*r, y2, start=180, extent=90, style="pieslice", **kwargs)
-    # center rectangle + sides
-    canvas.create_rectangle(x1+r/2, y1, x2-r/2, y2, **kwargs)
-    canvas.create_rectangle(x1, y1+r/2, x2, y2-r/2, **kwargs)
+SAVE_DELAY_MS = 500  # debounce window for writing habits.json
+
+# bottom wave animation
+WAVE_AMP = 8
+WAVE_FREQ = 2  # periods across the panel width
+WAVE_STEPS = 100
+WAVE_TABLE_SIZE = 1000
+WAVE_PHASE_STEP = 19  # ~0.12 rad per frame
+
+# bindtag shared by the cards canvas and the card buttons so the wheel scrolls over both
+SCROLL_TAG = "HabitScroll"
+
+def add_scroll_tag(widget: tk.Misc) -> None:
+    widget.bindtags(widget.bindtags() + (SCROLL_TAG,))
+
+# draw rounded rectangle on canvas as a pre-rendered image, cached in `cache`
+# (owned by the app, so the images never outlive their Tk root)
+def create_rounded_rect(canvas: tk.Canvas, cache: Dict[tuple, ImageTk.PhotoImage], x1, y1, x2, y2, r=12, fill="#FFFFFF", tags=None):
+    w = int(x2 - x1)
+    h = int(y2 - y1)
+    key = (w, h, r, fill)
+    img = cache.get(key)
+    if img is None:
+        # transparent corners so the shape blends with whatever is underneath
+        shape = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+        ImageDraw.Draw(shape).rounded_rectangle((0, 0, w-1, h-1), radius=r, fill=fill)
+        img = ImageTk.PhotoImage(shape)
+        cache[key] = img
+    return canvas.create_image(x1, y1, anchor="nw", image=img, tags=tags)
 
 # Main GUI
 class Card:
-    def __init__(self, parent_canvas: tk.Canvas, x, y, w, h, name, info, icon_img, on_mark, on_unmark, on_delete):
+    _next_id = 0
+
+    def __init__(self, parent_canvas: tk.Canvas, x, y, w, h, name, info, icon_img, on_mark, on_unmark, on_delete, rounded_cache):
         self.canvas = parent_canvas
+        self.rounded_cache = rounded_cache
         self.x = x; self.y = y; self.w = w; self.h = h
         self.name = name
         self.info = info
@@ -160,46 +66,71 @@ class Card:
         self.on_mark = on_mark
         self.on_unmark = on_unmark
         self.on_delete = on_delete
+        # every canvas item of this card carries this tag so it can be moved/deleted as a group
+        Card._next_id += 1
+        self.tag = f"card{Card._next_id}"
         self._build()
 
     def _build(self):
+        tags = ("card", self.tag)
         # shadow
-        shadow = self.canvas.create_rectangle(self.x+4, self.y+6, self.x+self.w+4, self.y+self.h+6, fill="#d6eaf8", outline="", tags="shadow")
-        # card background (rounded) — draw on a separate small canvas area by using rectangle & arcs
-        # we will draw a rounded rect by calling create_rounded_rect with a fill color
+        shadow = self.canvas.create_rectangle(self.x+4, self.y+6, self.x+self.w+4, self.y+self.h+6, fill="#d6eaf8", outline="", tags=("shadow", self.tag))
+        # card background (rounded) — one cached image shared by all cards of this size
         card_fill = rgb_to_hex(interp(CARD_TOP, CARD_BOTTOM, 0.1))
-        create_rounded_rect(self.canvas, self.x, self.y, self.x+self.w, self.y+self.h, r=14, fill=card_fill, outline="")
+        create_rounded_rect(self.canvas, self.rounded_cache, self.x, self.y, self.x+self.w, self.y+self.h, r=14, fill=card_fill, tags=tags)
         # icon or emoji
         icon_x = self.x + 18
         icon_y = self.y + self.h/2
         if self.icon_img:
             # create image
-            self.canvas.create_image(icon_x, icon_y, image=self.icon_img, anchor="center")
+            self.canvas.create_image(icon_x, icon_y, image=self.icon_img, anchor="center", tags=tags)
         else:
-            self.canvas.create_text(icon_x, icon_y, text="🌊", font=("Segoe UI", 14))
+            self.canvas.create_text(icon_x, icon_y, text="🌊", font=("Segoe UI", 14), tags=tags)
         # name
         name_x = self.x + 18 + ICON_SIZE + 8
-        self.canvas.create_text(name_x, self.y+20, text=self.name, anchor="w", font=("Segoe UI", 12, "bold"), fill=TEXT)
+        self.canvas.create_text(name_x, self.y+20, text=self.name, anchor="w", font=("Segoe UI", 12, "bold"), fill=TEXT, tags=tags)
         # streak and status
-        status = "✅" if self.info.get("done") else "❌"
-        streak = self.info.get("streak", 0)
-        self.canvas.create_text(name_x, self.y+44, text=f"{status}   Streak: {streak}", anchor="w", font=("Segoe UI", 10), fill=MUTED)
+        self._status_id = self.canvas.create_text(name_x, self.y+44, text=self._status_text(), anchor="w", font=("Segoe UI", 10), fill=MUTED, tags=tags)
         # action buttons (small) — we will use real Tk buttons placed over canvas via create_window
         btn_w = 60; btn_h = 28
         bx = self.x + self.w - btn_w - 12
         by = self.y + 14
         # Mark / Undo button label depends on state
+        self.mark_btn = tk.Button(self.canvas.master, width=6, bg="#E6F7FF", bd=0)
+        self._configure_mark_btn()
+        self.canvas.create_window(bx, by, anchor="nw", window=self.mark_btn, width=btn_w, height=btn_h, tags=tags)
+        # Delete button
+        self.del_btn = tk.Button(self.canvas.master, text="Delete", width=6, command=lambda n=self.name: self.on_delete(n), bg="#FFE9E9", bd=0)
+        self.canvas.create_window(bx, by+36, anchor="nw", window=self.del_btn, width=btn_w, height=btn_h, tags=tags)
+        add_scroll_tag(self.mark_btn)
+        add_scroll_tag(self.del_btn)
+
+    def _status_text(self):
+        status = "✅" if self.info.get("done") else "❌"
+        streak = self.info.get("streak", 0)
+        return f"{status}   Streak: {streak}"
+
+    def _configure_mark_btn(self):
         if self.info.get("done"):
-            text = "Undo"
-            cmd = lambda n=self.name: self.on_unmark(n)
+            self.mark_btn.config(text="Undo", command=lambda n=self.name: self.on_unmark(n))
         else:
-            text = "Done"
-            cmd = lambda n=self.name: self.on_mark(n)
-        mark_btn = tk.Button(self.canvas.master, text=text, width=6, command=cmd, bg="#E6F7FF", bd=0)
-        self.canvas.create_window(bx, by, anchor="nw", window=mark_btn, width=btn_w, height=btn_h)
-        # Delete button
-        del_btn = tk.Button(self.canvas.master, text="Delete", width=6, command=lambda n=self.name: self.on_delete(n), bg="#FFE9E9", bd=0)
-        self.canvas.create_window(bx, by+36, anchor="nw", window=del_btn, width=btn_w, height=btn_h)
+            self.mark_btn.config(text="Done", command=lambda n=self.name: self.on_mark(n))
+
+    def update(self, info):
+        # refresh status text and button in place, no widgets are recreated
+        self.info = info
+        self.canvas.itemconfig(self._status_id, text=self._status_text())
+        self._configure_mark_btn()
+
+    def move_to(self, x, y):
+        if (x, y) != (self.x, self.y):
+            self.canvas.move(self.tag, x - self.x, y - self.y)
+            self.x = x; self.y = y
+
+    def destroy(self):
+        self.canvas.delete(self.tag)
+        self.mark_btn.destroy()
+        self.del_btn.destroy()
 
 class OceanTrackerApp:
     def __init__(self, root):
@@ -210,13 +141,20 @@ class OceanTrackerApp:
 
         # data
         self.habits = load_habits()
-        ensure_defaults(self.habits)
+        _, added = ensure_defaults(self.habits)
         # reset daily if needed
-        reset_daily(self.habits)
-        save_habits(self.habits)
+        _, was_reset = reset_daily(self.habits)
+        # only touch the file when startup actually changed something
+        if added or was_reset:
+            save_habits(self.habits)
+        self._dirty = False
+        self._flush_after_id = None
+        root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # assets
         self.assets = {}
+        # pre-rendered rounded rectangles keyed by (w, h, r, fill)
+        self._rounded_cache: Dict[tuple, ImageTk.PhotoImage] = {}
         self._load_icons()
 
         # UI root canvas for gradient and wave
@@ -229,7 +167,7 @@ class OceanTrackerApp:
         cx = (820 - card_w)//2
         cy = 40
         # draw panel rounded rect
-        create_rounded_rect(self.bg_canvas, cx, cy, cx+card_w, cy+card_h, r=18, fill="#FFFFFF", outline="")
+        create_rounded_rect(self.bg_canvas, self._rounded_cache, cx, cy, cx+card_w, cy+card_h, r=18, fill="#FFFFFF")
         # title + wave small icon
         title_x = cx + 24
         title_y = cy + 18
@@ -249,19 +187,23 @@ class OceanTrackerApp:
         self.cards_canvas = tk.Canvas(self.bg_canvas, width=cards_w, height=cards_h, bg="#FFFFFF", highlightthickness=0)
         self.cards_canvas.place(x=cards_x, y=cards_y)
         # create internal canvas where we draw cards
-        self.card_draw_canvas = tk.Canvas(self.cards_canvas, width=cards_w, height=cards_h, bg="#FFFFFF", highlightthickness=0)
+        self.card_draw_canvas = tk.Canvas(self.cards_canvas, width=cards_w, height=cards_h, bg="#FFFFFF", highlightthickness=0,
+                                          yscrollincrement=20, confine=True)
         self.card_draw_canvas.pack()
-        # simple manual scrolling with wheel
-        self.card_draw_canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # simple scrolling with wheel (20px per notch)
+        add_scroll_tag(self.card_draw_canvas)
+        self.root.bind_class(SCROLL_TAG, "<MouseWheel>", self._on_mousewheel)
 
         # add controls on right bottom
         self._build_controls(cx+card_w-220, cy+card_h-140)
 
         # draw cards
+        self._cards: Dict[str, Card] = {}
+        # habit names kept sorted on add/delete so layout never re-sorts
+        self._sorted_names = sorted(k for k in self.habits if not k.startswith("_"))
         self._draw_cards()
 
         # wave animation area at bottom inside panel
-        self.wave_offset = 0.0
         self._animate_wave(cx, cy+card_h-60, card_w, 60)
 
     def _load_icons(self):
@@ -271,28 +213,31 @@ class OceanTrackerApp:
             p = assets_folder / f"{nm}.png"
             if p.exists():
                 try:
-                    img = tk.PhotoImage(file=str(p))
-                    self.assets[nm] = img
+                    # decode with Pillow and scale to the size the layout expects;
+                    # self.assets keeps the PhotoImage alive
+                    with Image.open(p) as src:
+                        icon = src.convert("RGBA").resize((ICON_SIZE, ICON_SIZE), Image.LANCZOS)
+                    self.assets[nm] = ImageTk.PhotoImage(icon)
                 except Exception:
                     self.assets[nm] = None
             else:
                 self.assets[nm] = None
 
     def _draw_gradient(self, canvas: tk.Canvas, w: int, h: int):
-        # vertical gradient by drawing many narrow rectangles
-        steps = 80
-        for i in range(steps):
-            t = i / (steps-1)
-            c = interp(GRAD_TOP, GRAD_BOTTOM, t)
-            canvas.create_rectangle(0, int(i*(h/steps)), w, int((i+1)*(h/steps)), outline="", fill=rgb_to_hex(c))
+        # vertical gradient rendered once into an image
+        img = ImageTk.PhotoImage(Image.fromarray(build_gradient(w, h, GRAD_TOP, GRAD_BOTTOM)))
+        # keep a reference so Tk does not drop the image
+        self._grad_img = img
+        canvas.create_image(0, 0, anchor="nw", image=img)
 
     def _on_mousewheel(self, event):
-        # simple scroll by moving the inner canvas content (we can move all items)
-        delta = int(-1*(event.delta/120)*20)
-        # move all items in card_draw_canvas
+        # scroll the viewport only; scrollregion is kept up to date in _layout_cards
+        # macOS sends small deltas, Windows multiples of 120: scroll at least one unit
+        if event.delta == 0:
+            return
+        steps = max(1, abs(event.delta) // 120)
+        delta = -steps if event.delta > 0 else steps
         self.card_draw_canvas.yview_scroll(delta, "units")
-        # move by shifting the canvas (simulate)
-        self.card_draw_canvas.move("all", 0, delta)
 
     def _build_controls(self, x, y):
         # Add Habit entry + buttons
@@ -313,68 +258,115 @@ class OceanTrackerApp:
             return
         try:
             add_habit(self.habits, name)
-            save_habits(self.habits)
+            bisect.insort(self._sorted_names, name)
+            self._mark_dirty()
             entry.delete(0, tk.END)
-            self._draw_cards()
+            self._layout_cards()
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     def _on_reset_daily(self):
-        reset_daily(self.habits)
-        save_habits(self.habits)
-        self._draw_cards()
+        _, changed = reset_daily(self.habits)
+        if changed:
+            self._mark_dirty()
+        for name, card in self._cards.items():
+            card.update(self.habits[name])
         messagebox.showinfo("Reset", "Daily done flags have been reset (streaks preserved).")
 
     def _on_save_exit(self):
-        save_habits(self.habits)
-        self.root.destroy()
+        self._close(force=True)
+
+    def _on_close(self):
+        # window X: only write if there are unsaved changes
+        self._close(force=False)
+
+    def _close(self, force):
+        # if saving fails, let the user choose between retrying later and quitting anyway
+        if self._flush(force=force) or messagebox.askyesno(
+                "Quit without saving?",
+                "Your habits could not be saved. Quit anyway and lose the unsaved changes?"):
+            self.root.destroy()
+
+    # persistence: coalesce rapid edits into one write
+    def _mark_dirty(self):
+        self._dirty = True
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+        self._flush_after_id = self.root.after(SAVE_DELAY_MS, self._flush_if_dirty)
+
+    def _flush_if_dirty(self):
+        self._flush_after_id = None
+        if self._dirty:
+            self._flush()
+
+    def _flush(self, force=False):
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+        if self._dirty or force:
+            try:
+                save_habits(self.habits)
+            except OSError as e:
+                # stay dirty so the next flush tries again
+                self._dirty = True
+                messagebox.showerror("Error", f"Could not save habits: {e}")
+                return False
+            self._dirty = False
+        return True
 
     def _draw_cards(self):
-        # clear canvas
+        # full rebuild: drop every card and lay them out again
+        for card in self._cards.values():
+            card.destroy()
+        self._cards.clear()
         self.card_draw_canvas.delete("all")
-        # layout two columns
+        self._layout_cards()
+
+    def _layout_cards(self):
+        # place cards in two columns, creating only the ones that do not exist yet
         padding = 12
         col_gap = 20
         col_w = (CARD_WIDTH)
         x0 = padding
         y0 = padding
-        items = [k for k in self.habits.keys() if not k.startswith("_")]
-        # sort to have stable order
-        items.sort()
+        items = self._sorted_names
         col = 0
         row = 0
         # ensure card_draw_canvas is tall enough
         per_row = 2
         count = len(items)
-        rows_needed = math.ceil(count / per_row)
+        rows_needed = (count + per_row - 1) // per_row
         total_height = rows_needed * (CARD_HEIGHT + padding) + padding
         self.card_draw_canvas.config(scrollregion=(0,0, self.card_draw_canvas.winfo_reqwidth(), total_height))
         for idx, name in enumerate(items):
-            info = self.habits[name]
             col = idx % 2
             row = idx // 2
             x = x0 + col * (col_w + col_gap)
             y = y0 + row * (CARD_HEIGHT + padding)
+            card = self._cards.get(name)
+            if card is not None:
+                card.move_to(x, y)
+                continue
             # draw card using Card class
             icon = self.assets.get("wave")
-            Card(self.card_draw_canvas, x, y, CARD_WIDTH, CARD_HEIGHT, name, info, icon,
-                 on_mark=self._handle_mark_done, on_unmark=self._handle_unmark, on_delete=self._handle_delete)
-        # draw final area filler if needed
+            self._cards[name] = Card(self.card_draw_canvas, x, y, CARD_WIDTH, CARD_HEIGHT, name, self.habits[name], icon,
+                                     on_mark=self._handle_mark_done, on_unmark=self._handle_unmark, on_delete=self._handle_delete,
+                                     rounded_cache=self._rounded_cache)
 
     # handlers used by Card
     def _handle_mark_done(self, name):
         try:
             mark_done(self.habits, name)
-            save_habits(self.habits)
-            self._draw_cards()
+            self._mark_dirty()
+            self._cards[name].update(self.habits[name])
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     def _handle_unmark(self, name):
         try:
             unmark_habit(self.habits, name)
-            save_habits(self.habits)
-            self._draw_cards()
+            self._mark_dirty()
+            self._cards[name].update(self.habits[name])
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -383,8 +375,12 @@ class OceanTrackerApp:
             return
         try:
             delete_habit(self.habits, name)
-            save_habits(self.habits)
-            self._draw_cards()
+            self._sorted_names.remove(name)
+            self._mark_dirty()
+            card = self._cards.pop(name, None)
+            if card is not None:
+                card.destroy()
+            self._layout_cards()
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -395,30 +391,29 @@ class OceanTrackerApp:
         self.bg_canvas.create_window(x, y, anchor="nw", window=self.wave_canvas)
         self.wave_w = w
         self.wave_h = h
-        self._wave_phase = 0.0
-        self._wave_id = None
+        # one sine period sampled WAVE_TABLE_SIZE times; phase moves by whole indices
+        self._sine_table = [self.wave_h/2 + math.sin(k / WAVE_TABLE_SIZE * 2*math.pi) * WAVE_AMP
+                            for k in range(WAVE_TABLE_SIZE)]
+        step = WAVE_TABLE_SIZE * WAVE_FREQ / WAVE_STEPS
+        self._wave_xs = [i / WAVE_STEPS * self.wave_w for i in range(WAVE_STEPS+1)]
+        self._wave_idx = [int(i * step) for i in range(WAVE_STEPS+1)]
+        self._wave_offset = 0
+        self._wave_id = self.wave_canvas.create_polygon(0, 0, 0, 0, 0, 0,
+                                                        fill=rgb_to_hex(interp(GRAD_BOTTOM, GRAD_TOP, 0.15)), outline="")
         self._update_wave()
-    
+
     def _update_wave(self):
-        c = self.wave_canvas
-        c.delete("all")
-        # parameters
-        points = []
-        amp = 8
-        freq = 2.0
-        phase = self._wave_phase
-        steps = 100
-        for i in range(steps+1):
-            t = i / steps
-            px = t * self.wave_w
-            py = self.wave_h/2 + math.sin(t * freq * 2*math.pi + phase) * amp
-            points.append((px, py))
-        # create polygon by connecting bottom corners
-        poly = [(0, self.wave_h)] + points + [(self.wave_w, self.wave_h)]
-        # flatten
-        flat = [coord for p in poly for coord in p]
-        c.create_polygon(flat, fill=rgb_to_hex(interp(GRAD_BOTTOM, GRAD_TOP, 0.15)), outline="")
-        self._wave_phase += 0.12
+        table = self._sine_table
+        offset = self._wave_offset
+        # polygon: bottom-left corner, the wave samples, bottom-right corner
+        flat = [0, self.wave_h]
+        for px, k in zip(self._wave_xs, self._wave_idx):
+            flat.append(px)
+            flat.append(table[(k + offset) % WAVE_TABLE_SIZE])
+        flat.append(self.wave_w)
+        flat.append(self.wave_h)
+        self.wave_canvas.coords(self._wave_id, *flat)
+        self._wave_offset = (offset + WAVE_PHASE_STEP) % WAVE_TABLE_SIZE
         self.root.after(60, self._update_wave)
 
 # Run
@@ -3,7 +3,8 @@ import os
 import json
 import datetime
 import tempfile
-from main import add_habit, mark_done, load_habits, save_habits
+import pytest
+from core import add_habit, mark_done, load_habits, save_habits, reset_daily
 
 def test_add_and_save_load(tmp_path):
     fname = tmp_path / "h.json"
@@ -35,3 +36,77 @@ def test_mark_done_errors():
         assert False, "Expected KeyError"
     except KeyError:
         pass
+
+def test_save_replaces_file_without_leftovers(tmp_path):
+    fname = tmp_path / "h3.json"
+    fname.write_text("{not valid json", encoding="utf-8")
+    habits = {}
+    add_habit(habits, "Swim")
+    save_habits(habits, filename=str(fname))
+    assert load_habits(filename=str(fname)) == habits
+    assert not (tmp_path / "h3.json.tmp").exists()
+
+def test_gradient_colors_match_interp():
+    # imported here so the core tests run without NumPy
+    pytest.importorskip("numpy")
+    from colors import gradient_colors, interp
+    top, bottom = (243, 251, 255), (45, 156, 219)
+    colors = gradient_colors(top, bottom, 5).tolist()
+    assert colors == [list(interp(top, bottom, i / 4)) for i in range(5)]
+
+def test_reset_daily_reports_change():
+    habits = {}
+    add_habit(habits, "Walk")
+    mark_done(habits, "Walk", today="2025-01-01")
+    _, changed = reset_daily(habits, today="2025-01-02")
+    assert changed
+    assert habits["Walk"]["done"] is False
+    _, changed = reset_daily(habits, today="2025-01-02")
+    assert not changed
+
+def test_failed_save_keeps_original(tmp_path, monkeypatch):
+    fname = tmp_path / "h4.json"
+    habits = {}
+    add_habit(habits, "Mine")
+    save_habits(habits, filename=str(fname))
+    before = fname.read_bytes()
+
+    def broken_fsync(fd):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "fsync", broken_fsync)
+    add_habit(habits, "Other")
+    with pytest.raises(OSError):
+        save_habits(habits, filename=str(fname))
+    assert fname.read_bytes() == before
+    assert not (tmp_path / "h4.json.tmp").exists()
+
+def test_short_writes_are_completed(tmp_path, monkeypatch):
+    fname = tmp_path / "h5.json"
+    real_write = os.write
+    # write at most 3 bytes per call, like a nearly-full disk
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, bytes(data[:3])))
+    habits = {}
+    add_habit(habits, "Mine")
+    save_habits(habits, filename=str(fname))
+    monkeypatch.undo()
+    assert load_habits(filename=str(fname)) == habits
+
+def test_add_habit_rejects_reserved_names():
+    habits = {}
+    with pytest.raises(ValueError):
+        add_habit(habits, "_meta")
+    with pytest.raises(ValueError):
+        add_habit(habits, "  _x")
+    assert habits == {}
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_save_keeps_file_mode(tmp_path):
+    fname = tmp_path / "h6.json"
+    habits = {}
+    add_habit(habits, "Mine")
+    save_habits(habits, filename=str(fname))
+    os.chmod(fname, 0o600)
+    add_habit(habits, "Other")
+    save_habits(habits, filename=str(fname))
+    assert (os.stat(fname).st_mode & 0o777) == 0o600
+    assert fname.read_bytes().count(b"\r") == 0